@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark the serial and parallel course loaders on synthetic course trees.
+
+Each tree is built in a temporary directory by copying the real course
+files under new course codes until it holds the requested number of files.
+
+Usage examples:
+  python bench_loader.py
+  python bench_loader.py --sizes 1000 10000 --workers 16
+"""
+
+import shutil
+import tempfile
+import time
+import argparse
+from pathlib import Path
+
+from query_courses import course_files, iter_courses, load_all_courses, load_all_courses_parallel
+
+CATALOG_DIR = Path(__file__).resolve().parent
+
+
+def build_tree(root, size, source=CATALOG_DIR / 'courses'):
+    """Write `size` course files under root/<level>-level/ based on the real catalog"""
+    templates = [(p.parent.name, p.stem, p.read_text()) for p in course_files(source)]
+    for i in range(size):
+        level_dir, code, content = templates[i % len(templates)]
+        new_code = f"DESN-{i:06d}"
+        target = root / level_dir
+        target.mkdir(exist_ok=True)
+        (target / f"{new_code}.md").write_text(content.replace(code, new_code))
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark serial vs parallel catalog loading')
+    parser.add_argument('--sizes', nargs='*', type=int, default=[1000, 10000, 100000], help='Tree sizes to test')
+    parser.add_argument('--workers', type=int, help='Pool size (default: executor default)')
+    parser.add_argument('--batch-size', type=int, default=64, help='Files per pool task')
+
+    args = parser.parse_args()
+
+    print(f"{'Files':>8} {'serial':>9} {'threads':>9} {'processes':>10} {'stream':>9}")
+    for size in args.sizes:
+        root = Path(tempfile.mkdtemp(prefix='catalog-bench-'))
+        try:
+            build_tree(root, size)
+            serial, courses = timed(lambda: load_all_courses(root))
+            threads, threaded = timed(lambda: load_all_courses_parallel(root, args.workers, False, args.batch_size))
+            processes, forked = timed(lambda: load_all_courses_parallel(root, args.workers, True, args.batch_size))
+            stream, count = timed(lambda: sum(1 for _ in iter_courses(root, args.workers, False, args.batch_size)))
+            assert len(courses) == len(threaded) == len(forked) == count == size
+            print(f"{size:>8} {serial:>8.2f}s {threads:>8.2f}s {processes:>9.2f}s {stream:>8.2f}s")
+        finally:
+            shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
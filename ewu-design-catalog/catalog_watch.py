@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Keep derived catalog artifacts up to date while course files are edited.
+
+Watches courses/*-level/*.md and, when files change, reparses only those
+files, patches the in-memory index, search index and prerequisite graph,
+and rewrites:
+  build/course-index.json        compiled course metadata, keyed by code
+  build/search-index.json        token -> course codes (name, track, topics)
+  build/prerequisite-graph.json  prerequisites/unlocks, same course schema
+                                 as ../data/prerequisite-graph.json
+
+Changes are detected by polling file stats; bursts of saves are debounced
+and coalesced into a single rebuild.
+
+Usage examples:
+  python catalog_watch.py
+  python catalog_watch.py --once
+  python query_courses.py --watch
+"""
+
+import json
+import os
+import re
+import time
+import argparse
+from pathlib import Path
+
+from query_courses import course_files, parse_course_file
+from validate_catalog import CATALOG_DIR, load_markdown_courses, normalize_code, prerequisite_codes
+
+TOKEN_RE = re.compile(r'[a-z0-9+#]+')
+
+
+def course_tokens(course):
+    """Searchable tokens for a course: code, name, track and topics"""
+    code = normalize_code(course.get('course_code', ''))
+    text = ' '.join([course.get('course_name', ''), course.get('track', '')] + list(course.get('topics', [])))
+    tokens = set(TOKEN_RE.findall(text.lower()))
+    tokens.update({code.lower(), code.split('-')[-1]})
+    return tokens
+
+
+class CatalogState:
+    """In-memory catalog index with incrementally maintained derived views
+
+    Records are tracked per file; when several files claim the same course
+    code, the first path (sorted) wins and the clash is reported by
+    duplicates() until one of them is fixed.
+    """
+
+    def __init__(self, base_path):
+        self.base_path = Path(base_path)
+        self.records = {}
+        self.paths = {}
+        self.by_code = {}
+        self.tokens = {}
+        self.search = {}
+        self.prereqs = {}
+        self.unlocks = {}
+        try:
+            courses = load_markdown_courses(self.base_path)
+        except Exception:
+            # Some file doesn't parse; fall back to per-file loading so the rest still load
+            for course_file in course_files(self.base_path):
+                self.update(course_file)
+        else:
+            for course in courses:
+                self.set_record(course['filepath'], course)
+
+    def set_record(self, filepath, course):
+        """Replace (or with course=None, forget) the record parsed from one file"""
+        old = self.records.pop(filepath, None)
+        if old is not None:
+            code = normalize_code(old.get('course_code', ''))
+            self.paths[code].discard(filepath)
+            if not self.paths[code]:
+                del self.paths[code]
+            self.refresh(code)
+        if course is not None:
+            code = normalize_code(course.get('course_code', ''))
+            self.records[filepath] = course
+            self.paths.setdefault(code, set()).add(filepath)
+            self.refresh(code)
+
+    def refresh(self, code):
+        """Rebuild every derived view for one code from the files that still define it"""
+        self.unindex(code)
+        paths = self.paths.get(code)
+        if paths:
+            self.index(code, self.records[min(paths)])
+
+    def index(self, code, course):
+        self.by_code[code] = course
+
+        self.tokens[code] = course_tokens(course)
+        for token in self.tokens[code]:
+            self.search.setdefault(token, set()).add(code)
+
+        self.prereqs[code] = prerequisite_codes(course.get('prerequisites', []))
+        for prereq in self.prereqs[code]:
+            self.unlocks.setdefault(prereq, set()).add(code)
+
+    def unindex(self, code):
+        self.by_code.pop(code, None)
+
+        for token in self.tokens.pop(code, ()):
+            codes = self.search.get(token)
+            codes.discard(code)
+            if not codes:
+                del self.search[token]
+
+        for prereq in self.prereqs.pop(code, ()):
+            dependents = self.unlocks.get(prereq)
+            dependents.discard(code)
+            if not dependents:
+                del self.unlocks[prereq]
+
+    def update(self, filepath):
+        """Reparse one file (or drop it if it was deleted) and patch every view.
+
+        A file that fails to parse keeps its last good record; returns False then.
+        """
+        filepath = str(filepath)
+        if not os.path.exists(filepath):
+            self.set_record(filepath, None)
+            return True
+        try:
+            course = parse_course_file(filepath)
+            if not course:
+                raise ValueError('no frontmatter')
+        except Exception as e:
+            print(f"  ! {filepath}: {type(e).__name__}: {e} (keeping last good version)")
+            return False
+        self.set_record(filepath, course)
+        return True
+
+    def duplicates(self):
+        """Course codes claimed by more than one file"""
+        return {code: sorted(paths) for code, paths in sorted(self.paths.items()) if len(paths) > 1}
+
+    def compiled_index(self):
+        return {code: {k: v for k, v in course.items() if k != 'filepath'}
+                for code, course in sorted(self.by_code.items())}
+
+    def search_index(self):
+        return {token: sorted(codes) for token, codes in sorted(self.search.items())}
+
+    def prerequisite_graph(self):
+        courses = {}
+        for code, course in sorted(self.by_code.items()):
+            courses[code] = {
+                'code': code,
+                'title': course.get('course_name'),
+                'credits': course.get('credits'),
+                'level': course.get('level'),
+                'prerequisites': sorted(self.prereqs[code]),
+                'unlocks': sorted(self.unlocks.get(code, ())),
+                'tracks': [course['track']] if course.get('track') else [],
+            }
+        return {
+            'metadata': {'generatedFrom': 'ewu-design-catalog/courses', 'courseCount': len(courses)},
+            'courses': courses,
+        }
+
+    def write(self, output_dir):
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        write_json(output_dir / 'course-index.json', self.compiled_index())
+        write_json(output_dir / 'search-index.json', self.search_index())
+        write_json(output_dir / 'prerequisite-graph.json', self.prerequisite_graph())
+
+
+def write_json(path, data):
+    """Write via a temp file so readers never see a half-written artifact"""
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(data, f, indent=2)
+        f.write('\n')
+    os.replace(tmp, path)
+
+
+def snapshot(base_path):
+    """Map each course file to its (mtime, size) so edits and deletes show up as diffs"""
+    stats = {}
+    for course_file in course_files(base_path):
+        try:
+            st = course_file.stat()
+        except FileNotFoundError:
+            continue
+        stats[str(course_file)] = (st.st_mtime_ns, st.st_size)
+    return stats
+
+
+def report_duplicates(state):
+    for code, paths in state.duplicates().items():
+        print(f"  ! {code} is defined by {len(paths)} files: {', '.join(paths)} (using the first)")
+
+
+def watch(base_path=CATALOG_DIR / 'courses', output_dir=CATALOG_DIR / 'build', interval=0.5, debounce=0.3):
+    """Poll the course tree forever, rebuilding artifacts after each quiet period"""
+    state = CatalogState(base_path)
+    state.write(output_dir)
+    print(f"Watching {base_path} ({len(state.by_code)} courses) -> {output_dir}")
+    report_duplicates(state)
+
+    previous = snapshot(base_path)
+    pending = set()
+    last_change = 0.0
+    try:
+        while True:
+            time.sleep(interval)
+            current = snapshot(base_path)
+            changed = {p for p in current.keys() | previous.keys() if current.get(p) != previous.get(p)}
+            previous = current
+            if changed:
+                pending |= changed
+                last_change = time.monotonic()
+                continue
+            if pending and time.monotonic() - last_change >= debounce:
+                for filepath in sorted(pending):
+                    state.update(filepath)
+                state.write(output_dir)
+                names = ', '.join(Path(p).stem for p in sorted(pending))
+                print(f"Rebuilt after {len(pending)} change(s): {names}")
+                report_duplicates(state)
+                pending.clear()
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rebuild derived catalog artifacts on change')
+    parser.add_argument('--courses', default=str(CATALOG_DIR / 'courses'), help='Course markdown directory')
+    parser.add_argument('--output', default=str(CATALOG_DIR / 'build'), help='Directory for derived artifacts')
+    parser.add_argument('--interval', type=float, default=0.5, help='Polling interval in seconds')
+    parser.add_argument('--debounce', type=float, default=0.3, help='Quiet period before rebuilding')
+    parser.add_argument('--once', action='store_true', help='Build the artifacts once and exit')
+
+    args = parser.parse_args()
+
+    if args.once:
+        state = CatalogState(args.courses)
+        state.write(args.output)
+        print(f"Wrote artifacts for {len(state.by_code)} courses to {args.output}")
+        report_duplicates(state)
+        return
+
+    watch(args.courses, args.output, args.interval, args.debounce)
+
+
+if __name__ == '__main__':
+    main()
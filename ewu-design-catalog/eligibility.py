@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Transcript eligibility engine for the EWU Design course catalog.
+
+Every course code is interned to a bit position, and each course's
+prerequisites are compiled to bitmasks once: a mask of courses that are
+all required, plus one mask per "or" group where any one will do. A
+transcript is then a single integer and eligibility is a handful of AND
+operations per course.
+
+Prerequisites that a transcript can't answer (standing, instructor
+permission) are not enforced; such courses are reported as conditional.
+An "or" group mixing courses with free text ("DESN-100 or instructor
+permission") is compiled to a mask of its course alternatives: a
+transcript that has one of them meets the group outright, otherwise the
+course is conditional rather than blocked.
+
+Usage examples:
+  python eligibility.py --completed DESN-100 DESN-216
+  python eligibility.py --transcripts registrar-export.csv --output eligible.csv
+
+Transcript CSVs need a student_id column plus either a `courses` column
+(codes separated by ';' or whitespace) or a `course_code` column with one
+row per completed course, rows for the same student kept together.
+"""
+
+import csv
+import sys
+import argparse
+from itertools import groupby
+
+from validate_catalog import (
+    CATALOG_DIR, COURSE_CODE_RE, load_markdown_courses, normalize_code, split_requirement,
+)
+
+
+class EligibilityEngine:
+    """Bitmask prerequisite checker over an interned set of course codes"""
+
+    def __init__(self, courses):
+        self.codes = []
+        self.bit = {}
+        for course in sorted(courses, key=lambda c: normalize_code(c.get('course_code', ''))):
+            self.intern(normalize_code(course.get('course_code', '')))
+
+        # Per course: (code, own bit, all-of mask, [any-of masks], [unenforced-group masks], repeatable)
+        self.rules = []
+        # Per course: requirement groups left unenforced, as lists of alternatives
+        self.conditions = {}
+        for course in courses:
+            code = normalize_code(course.get('course_code', ''))
+            required, any_of, conditions = self.compile_prerequisites(course.get('prerequisites', []))
+            repeatable = str(course.get('repeatable', '')).lower() == 'true'
+            self.conditions[code] = conditions
+            mixed = [self.group_mask(group) for group in conditions]
+            self.rules.append((code, self.bit[code], required, any_of, mixed, repeatable))
+        self.rules.sort()
+
+    def intern(self, code):
+        if code not in self.bit:
+            self.bit[code] = 1 << len(self.codes)
+            self.codes.append(code)
+        return self.bit[code]
+
+    def group_mask(self, alternatives):
+        """Mask of the course-code alternatives in a requirement group (0 if it has none)"""
+        mask = 0
+        for alternative in alternatives:
+            if COURSE_CODE_RE.fullmatch(alternative.upper()):
+                mask |= self.intern(normalize_code(alternative))
+        return mask
+
+    def compile_prerequisites(self, prereqs):
+        """Compile a prerequisite list into (all-of mask, any-of masks, unenforced groups)"""
+        if isinstance(prereqs, str):
+            prereqs = [prereqs] if prereqs else []
+        required = 0
+        any_of = []
+        conditions = []
+        for requirement in prereqs:
+            alternatives = split_requirement(requirement)
+            if not all(COURSE_CODE_RE.fullmatch(alt.upper()) for alt in alternatives):
+                # Standing/permission can satisfy this group: can't be decided from a transcript
+                conditions.append(alternatives)
+                continue
+            mask = self.group_mask(alternatives)
+            if len(alternatives) == 1:
+                required |= mask
+            elif mask:
+                any_of.append(mask)
+        return required, any_of, conditions
+
+    def transcript_mask(self, completed):
+        """Fold a collection of completed course codes into a bitmask"""
+        mask = 0
+        for code in completed:
+            mask |= self.bit.get(normalize_code(code), 0)
+        return mask
+
+    def eligible(self, completed):
+        """Return [(course_code, conditional)] for every course the transcript unlocks"""
+        done = completed if isinstance(completed, int) else self.transcript_mask(completed)
+        result = []
+        for code, own, required, any_of, mixed, repeatable in self.rules:
+            if done & own and not repeatable:
+                continue
+            if done & required != required:
+                continue
+            if all(done & mask for mask in any_of):
+                # Only unmet free-text groups leave the course conditional
+                result.append((code, any(not done & mask for mask in mixed)))
+        return result
+
+
+def read_transcripts(path):
+    """Stream (student_id, [course codes]) pairs from a registrar CSV export"""
+    with open(path, 'r', newline='') as f:
+        reader = csv.DictReader(f)
+        fields = reader.fieldnames or []
+        if 'student_id' not in fields:
+            raise ValueError(f"{path}: missing student_id column")
+        if 'courses' in fields:
+            for row in reader:
+                yield row['student_id'], row['courses'].replace(';', ' ').split()
+        elif 'course_code' in fields:
+            for student_id, rows in groupby(reader, key=lambda r: r['student_id']):
+                yield student_id, [r['course_code'] for r in rows if r['course_code']]
+        else:
+            raise ValueError(f"{path}: expected a 'courses' or 'course_code' column")
+
+
+def format_course(code, conditional):
+    return f"{code}*" if conditional else code
+
+
+def main():
+    parser = argparse.ArgumentParser(description='List courses a student is eligible to take next')
+    parser.add_argument('--completed', nargs='*', metavar='CODE', help='Completed course codes')
+    parser.add_argument('--transcripts', help='Registrar CSV export to process in batch')
+    parser.add_argument('--output', help='Write batch results to this CSV instead of stdout')
+    parser.add_argument('--courses', default=str(CATALOG_DIR / 'courses'), help='Course markdown directory')
+
+    args = parser.parse_args()
+    if args.completed is None and not args.transcripts:
+        parser.error('one of --completed or --transcripts is required')
+
+    engine = EligibilityEngine(load_markdown_courses(args.courses))
+
+    if args.transcripts:
+        out = open(args.output, 'w', newline='') if args.output else sys.stdout
+        try:
+            writer = csv.writer(out)
+            writer.writerow(['student_id', 'eligible'])
+            count = 0
+            for student_id, completed in read_transcripts(args.transcripts):
+                eligible = engine.eligible(completed)
+                writer.writerow([student_id, ';'.join(format_course(*e) for e in eligible)])
+                count += 1
+        finally:
+            if out is not sys.stdout:
+                out.close()
+        print(f"Processed {count} transcripts", file=sys.stderr)
+        return
+
+    eligible = engine.eligible(args.completed)
+    print(f"Eligible courses ({len(eligible)}):")
+    for code, conditional in eligible:
+        note = "  (also requires standing or permission)" if conditional else ""
+        print(f"  - {code}{note}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Enrollment trend store for EWU Design census data.
+
+Keeps one preallocated float array per course (NaN where the course was
+not offered) and updates rolling means, year-over-year growth and running
+mean/variance as each quarter is appended, so adding a quarter costs
+O(courses) rather than a recomputation over the whole history. A quarter
+is flagged when its enrollment is more than --threshold standard
+deviations away from that course's history.
+
+Usage examples:
+  python enrollment_trends.py
+  python enrollment_trends.py --track web-development
+  python enrollment_trends.py --level 300 --anomalies
+  python enrollment_trends.py --course DESN-368
+"""
+
+import csv
+import math
+import argparse
+from array import array
+
+from validate_catalog import CATALOG_DIR, load_markdown_courses, normalize_code
+
+ENROLLMENT_CSV = CATALOG_DIR.parent / 'enrollment-data' / 'processed' / 'corrected-all-quarters.csv'
+QUARTER_ORDER = {'Fall': 0, 'Winter': 1, 'Spring': 2, 'Summer': 3}
+NAN = float('nan')
+
+
+def previous_year_label(label):
+    """'Winter 2024-25' -> 'Winter 2023-24', the quarter year-over-year growth compares against"""
+    quarter, _, year = label.rpartition(' ')
+    try:
+        start = int(year.split('-')[0]) - 1
+    except ValueError:
+        return None
+    return f"{quarter} {start}-{str(start + 1)[-2:]}"
+
+
+class EnrollmentSeries:
+    """Per-course, per-quarter enrollment with incrementally maintained aggregates"""
+
+    def __init__(self, window=3, threshold=2.0, min_history=3, capacity=16):
+        self.window = window
+        self.threshold = threshold
+        self.min_history = min_history
+        self.capacity = capacity
+
+        self.quarters = []
+        self.column = {}
+        self.codes = []
+        self.row = {}
+        self.values = []
+
+        # Running state, one slot per course
+        self.rolling_sum = array('d')
+        self.rolling_count = array('l')
+        self.count = array('l')
+        self.mean = array('d')
+        self.m2 = array('d')
+        self.growth = array('d')
+        self.zscore = array('d')
+
+    def add_course(self, code):
+        if code in self.row:
+            return self.row[code]
+        self.row[code] = len(self.codes)
+        self.codes.append(code)
+        self.values.append(array('d', [NAN]) * self.capacity)
+        for column in (self.rolling_sum, self.mean, self.m2):
+            column.append(0.0)
+        for column in (self.rolling_count, self.count):
+            column.append(0)
+        self.growth.append(NAN)
+        self.zscore.append(NAN)
+        return self.row[code]
+
+    def grow(self):
+        """Double the preallocated history so appends stay amortized O(courses)"""
+        for row in self.values:
+            row.extend(array('d', [NAN]) * self.capacity)
+        self.capacity *= 2
+
+    def append_quarter(self, label, enrollments):
+        """Append one quarter ('Fall 2024-25') of {course_code: enrollment} and update every aggregate"""
+        for code in enrollments:
+            self.add_course(code)
+        t = len(self.quarters)
+        if t == self.capacity:
+            self.grow()
+        self.quarters.append(label)
+        self.column[label] = t
+        last_year = self.column.get(previous_year_label(label))
+
+        for i, code in enumerate(self.codes):
+            value = float(enrollments.get(code, NAN))
+            series = self.values[i]
+            series[t] = value
+
+            if t >= self.window:
+                leaving = series[t - self.window]
+                if not math.isnan(leaving):
+                    self.rolling_sum[i] -= leaving
+                    self.rolling_count[i] -= 1
+
+            if math.isnan(value):
+                self.growth[i] = NAN
+                self.zscore[i] = NAN
+                continue
+
+            self.rolling_sum[i] += value
+            self.rolling_count[i] += 1
+
+            previous = series[last_year] if last_year is not None else NAN
+            self.growth[i] = (value - previous) / previous if previous and not math.isnan(previous) else NAN
+
+            # Score against the history *before* this quarter, then fold it in (Welford)
+            n = self.count[i]
+            std = math.sqrt(self.m2[i] / (n - 1)) if n > 1 else 0.0
+            self.zscore[i] = (value - self.mean[i]) / std if n >= self.min_history and std else NAN
+
+            n += 1
+            delta = value - self.mean[i]
+            self.mean[i] += delta / n
+            self.m2[i] += delta * (value - self.mean[i])
+            self.count[i] = n
+
+    def series(self, code):
+        i = self.row[code]
+        return list(zip(self.quarters, self.values[i][:len(self.quarters)]))
+
+    def latest(self, code):
+        """Latest-quarter summary for one course"""
+        i = self.row[code]
+        t = len(self.quarters) - 1
+        rolling = self.rolling_sum[i] / self.rolling_count[i] if self.rolling_count[i] else NAN
+        zscore = self.zscore[i]
+        flag = ''
+        if not math.isnan(zscore) and abs(zscore) >= self.threshold:
+            flag = 'surge' if zscore > 0 else 'drop'
+        return {
+            'code': code,
+            'quarter': self.quarters[t] if t >= 0 else None,
+            'enrolled': self.values[i][t] if t >= 0 else NAN,
+            'rolling_mean': rolling,
+            'history_mean': self.mean[i] if self.count[i] else NAN,
+            'yoy_growth': self.growth[i],
+            'zscore': zscore,
+            'flag': flag,
+        }
+
+    def summary(self, codes=None):
+        return [self.latest(code) for code in sorted(codes if codes is not None else self.codes)
+                if code in self.row]
+
+
+def read_quarters(path=ENROLLMENT_CSV):
+    """Return [(label, {course_code: enrolled})] in chronological order"""
+    totals = {}
+    with open(path, 'r', newline='') as f:
+        for row in csv.DictReader(f):
+            key = (row['AcademicYear'], QUARTER_ORDER.get(row['Quarter'], 9), row['Quarter'])
+            code = normalize_code(row['CourseCode'])
+            quarter = totals.setdefault(key, {})
+            quarter[code] = quarter.get(code, 0) + int(row['Enrolled'] or 0)
+    return [(f"{quarter} {year}", totals[(year, order, quarter)])
+            for year, order, quarter in sorted(totals)]
+
+
+def load_series(path=ENROLLMENT_CSV, **options):
+    store = EnrollmentSeries(**options)
+    for label, enrollments in read_quarters(path):
+        store.append_quarter(label, enrollments)
+    return store
+
+
+def catalog_filter(courses, track=None, level=None):
+    """Course codes in the catalog index matching a track and/or level"""
+    codes = set()
+    for course in courses:
+        if track and course.get('track') != track:
+            continue
+        if level and str(course.get('level')) != str(level):
+            continue
+        codes.add(normalize_code(course.get('course_code', '')))
+    return codes
+
+
+def fmt(value, pattern):
+    return '-' if math.isnan(value) else pattern.format(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Enrollment trends and anomalies by course')
+    parser.add_argument('--csv', default=str(ENROLLMENT_CSV), help='Census enrollment CSV')
+    parser.add_argument('--course', help='Show the full series for one course')
+    parser.add_argument('--track', help='Only courses in this catalog track')
+    parser.add_argument('--level', help='Only courses at this catalog level')
+    parser.add_argument('--anomalies', action='store_true', help='Only courses flagged this quarter')
+    parser.add_argument('--window', type=int, default=3, help='Rolling-mean window in quarters')
+    parser.add_argument('--threshold', type=float, default=2.0, help='Z-score that counts as anomalous')
+
+    args = parser.parse_args()
+
+    store = load_series(args.csv, window=args.window, threshold=args.threshold)
+    print(f"Loaded {len(store.quarters)} quarters for {len(store.codes)} courses\n")
+
+    if args.course:
+        code = normalize_code(args.course)
+        if code not in store.row:
+            print(f"No enrollment data for {code}")
+            return
+        print(f"Enrollment for {code}:")
+        for label, value in store.series(code):
+            print(f"  {label:<14} {fmt(value, '{:.0f}')}")
+        return
+
+    codes = None
+    if args.track or args.level:
+        codes = catalog_filter(load_markdown_courses(CATALOG_DIR / 'courses'), args.track, args.level)
+
+    rows = store.summary(codes)
+    if args.anomalies:
+        rows = [r for r in rows if r['flag']]
+
+    print(f"{'Course':<10} {'Latest':>7} {'Rolling':>8} {'Mean':>6} {'YoY':>7} {'z':>6}  Flag")
+    for r in rows:
+        print(f"{r['code']:<10} {fmt(r['enrolled'], '{:.0f}'):>7} {fmt(r['rolling_mean'], '{:.1f}'):>8} "
+              f"{fmt(r['history_mean'], '{:.1f}'):>6} {fmt(r['yoy_growth'], '{:+.0%}'):>7} "
+              f"{fmt(r['zscore'], '{:+.1f}'):>6}  {r['flag']}")
+
+
+if __name__ == '__main__':
+    main()
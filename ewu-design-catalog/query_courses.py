@@ -6,11 +6,15 @@ Usage examples:
   python query_courses.py --unlocks DESN-216
   python query_courses.py --track web-development
   python query_courses.py --level 300
+  python query_courses.py --watch
 """
 
 import os
 import re
 import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 def parse_frontmatter(content):
@@ -68,6 +72,52 @@ def load_all_courses(base_path='courses'):
     
     return courses
 
+def course_files(base_path='courses'):
+    """Course markdown files in a stable order (level directory, then file name)"""
+    return sorted(Path(base_path).glob('*-level/*.md'))
+
+def parse_course_file(course_file):
+    """Read and parse a single course file; returns {} if it has no frontmatter"""
+    with open(course_file, 'r') as f:
+        metadata = parse_frontmatter(f.read())
+    if metadata:
+        metadata['filepath'] = str(course_file)
+    return metadata
+
+def parse_course_batch(paths):
+    """Parse a batch of course files (one task per batch keeps pool overhead low)"""
+    return [parse_course_file(p) for p in paths]
+
+def iter_courses(base_path='courses', workers=None, processes=False, batch_size=64, max_pending=None):
+    """Yield course metadata in file order, reading/parsing batches on a pool.
+    
+    Threads suit I/O-bound trees (network mounts); processes=True moves parsing
+    off the GIL. At most max_pending batches (default 2 per worker) are in
+    flight, so memory stays bounded however large the tree is.
+    """
+    files = iter(course_files(base_path))
+    batches = iter(lambda: list(islice(files, batch_size)), [])
+    if processes:
+        pool_class, workers = ProcessPoolExecutor, workers or os.cpu_count() or 1
+    else:
+        pool_class, workers = ThreadPoolExecutor, workers or min(32, (os.cpu_count() or 1) + 4)
+    limit = max_pending or 2 * workers
+    
+    with pool_class(max_workers=workers) as pool:
+        pending = deque(pool.submit(parse_course_batch, b) for b in islice(batches, limit))
+        while pending:
+            results = pending.popleft().result()
+            batch = next(batches, None)
+            if batch is not None:
+                pending.append(pool.submit(parse_course_batch, batch))
+            for metadata in results:
+                if metadata:
+                    yield metadata
+
+def load_all_courses_parallel(base_path='courses', workers=None, processes=False, batch_size=64):
+    """Parallel counterpart to load_all_courses, returning courses in file order"""
+    return list(iter_courses(base_path, workers, processes, batch_size))
+
 def find_prerequisites(course_code, courses):
     """Find what prerequisites a course requires"""
     for course in courses:
@@ -127,9 +177,15 @@ def main():
     parser.add_argument('--sequence-forward', help='Show forward sequence from course')
     parser.add_argument('--sequence-backward', help='Show backward sequence to course')
     parser.add_argument('--list-tracks', action='store_true', help='List all tracks')
+    parser.add_argument('--watch', action='store_true', help='Rebuild derived artifacts in build/ on every change')
     
     args = parser.parse_args()
     
+    if args.watch:
+        from catalog_watch import watch
+        watch()
+        return
+    
     # Load all courses
     courses = load_all_courses()
     print(f"Loaded {len(courses)} courses\n")
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Seat-level registration simulator for proposed quarterly schedules.
+
+Takes one or more schedules in the format of
+../data/winter-2026-enrollments.json (sections with capacities), draws a
+synthetic student population whose course requests follow historical
+census enrollment for that quarter, and replays registration as a
+priority-queue event loop:
+
+  - registration windows open by class standing (seniors first)
+  - each student requests only courses the prerequisite graph and their
+    class standing allow ("junior standing" = 3rd year+, "senior standing"
+    = 4th year); permission-only courses are listed separately, not simulated
+  - sections fill in the configured order; full courses go to a waitlist
+  - drops free seats that are offered to the waitlist in order
+
+Reports enrolled, waitlisted and turned-away counts per course, so
+candidate schedules can be compared on the same population.
+
+Usage examples:
+  python registration_sim.py
+  python registration_sim.py --students 20000 --seed 7
+  python registration_sim.py --schedule a.json b.json --fill balanced
+"""
+
+import csv
+import heapq
+import json
+import random
+import argparse
+from collections import deque
+
+from eligibility import EligibilityEngine
+from enrollment_trends import ENROLLMENT_CSV
+from validate_catalog import CATALOG_DIR, COURSE_CODE_RE, load_markdown_courses, normalize_code
+
+DEFAULT_SCHEDULE = CATALOG_DIR.parent / 'data' / 'winter-2026-enrollments.json'
+
+# Event kinds, ordered so that drops at the same instant free seats before new requests
+DROP, REGISTER = 0, 1
+
+# Share of the population in each class standing (1 = first year) and when their window opens (hours)
+STANDINGS = {4: (0.25, 0), 3: (0.25, 24), 2: (0.25, 48), 1: (0.25, 72)}
+MIN_STANDING = {'junior standing': 3, 'senior standing': 4}
+
+
+def is_permission(alternative):
+    return 'permission' in alternative.lower()
+
+
+def permission_only(engine, code):
+    """True if some requirement group of the course can only be met by permission"""
+    return any(all(is_permission(alt) for alt in group) for group in engine.conditions.get(code, []))
+
+
+def meets_conditions(engine, code, standing, completed):
+    """Evaluate the groups the eligibility engine leaves unenforced; permission is never assumed"""
+    for group in engine.conditions.get(code, []):
+        for alternative in group:
+            if COURSE_CODE_RE.fullmatch(alternative.upper()):
+                if completed & engine.bit.get(normalize_code(alternative), 0):
+                    break
+            elif standing >= MIN_STANDING.get(alternative.lower(), 99):
+                break
+        else:
+            return False
+    return True
+
+
+def load_schedule(path):
+    """Return (term, quarter, [section dicts]) from a term enrollment JSON"""
+    with open(path, 'r') as f:
+        data = json.load(f)
+    term = data.get('term', str(path))
+    sections = [{
+        'code': normalize_code(c['code']),
+        'section': c.get('section', ''),
+        'capacity': int(c.get('capacity') or 0),
+    } for c in data.get('courses', [])]
+    return term, term.split()[0], sections
+
+
+def historical_demand(quarter, path=ENROLLMENT_CSV):
+    """Mean census enrollment per course for a quarter name across all years"""
+    totals = {}
+    years = set()
+    with open(path, 'r', newline='') as f:
+        for row in csv.DictReader(f):
+            if row['Quarter'] != quarter:
+                continue
+            years.add(row['AcademicYear'])
+            code = normalize_code(row['CourseCode'])
+            totals[code] = totals.get(code, 0) + int(row['Enrolled'] or 0)
+    return {code: total / len(years) for code, total in totals.items()} if years else {}
+
+
+class Population:
+    """Synthetic students: standing, completed-course mask and ranked course requests"""
+
+    def __init__(self, engine, courses, offered, demand, size, courses_per_student, rng):
+        levels = {normalize_code(c.get('course_code', '')): int(c.get('level') or 0) for c in courses}
+        self.students = []
+        self.permission_only = [code for code in offered if permission_only(engine, code)]
+        requestable = [code for code in offered if code not in self.permission_only]
+
+        standings = list(STANDINGS)
+        weights = [STANDINGS[s][0] for s in standings]
+        for student_id in range(size):
+            standing = rng.choices(standings, weights)[0]
+            completed = 0
+            for code, bit in engine.bit.items():
+                level = levels.get(code)
+                if level is None:
+                    # Non-DESN prerequisites (ENGL-101, ...): assume done after the first year
+                    if standing > 1:
+                        completed |= bit
+                elif level < 100 * standing and rng.random() < 0.6:
+                    completed |= bit
+
+            eligible = {code for code, conditional in engine.eligible(completed)
+                        if not conditional or meets_conditions(engine, code, standing, completed)}
+            options = [code for code in requestable
+                       if code in eligible or code not in engine.bit]
+            requests = []
+            if options:
+                option_weights = [demand.get(code, 1.0) + 1.0 for code in options]
+                k = min(len(options), max(1, round(rng.gauss(courses_per_student, 0.75))))
+                while len(requests) < k:
+                    pick = rng.choices(options, option_weights)[0]
+                    if pick not in requests:
+                        requests.append(pick)
+            self.students.append((student_id, standing, requests))
+
+
+class RegistrationSimulation:
+    """Discrete-event registration run over one schedule"""
+
+    def __init__(self, sections, fill='listed', waitlist_per_section=10, drop_rate=0.08, rng=None):
+        self.fill = fill
+        self.drop_rate = drop_rate
+        self.rng = rng or random.Random()
+
+        self.sections = {}
+        for s in sections:
+            self.sections.setdefault(s['code'], []).append({**s, 'enrolled': 0})
+        self.waitlist = {code: deque() for code in self.sections}
+        self.waitlist_cap = {code: waitlist_per_section * len(secs) for code, secs in self.sections.items()}
+        self.stats = {code: {'demand': 0, 'enrolled': 0, 'waitlisted': 0, 'turned_away': 0, 'drops': 0}
+                      for code in self.sections}
+        self.events = []
+        self.seq = 0
+
+    def schedule(self, time, kind, payload):
+        heapq.heappush(self.events, (time, kind, self.seq, payload))
+        self.seq += 1
+
+    def open_section(self, code):
+        open_sections = [s for s in self.sections[code] if s['enrolled'] < s['capacity']]
+        if not open_sections:
+            return None
+        if self.fill == 'balanced':
+            return max(open_sections, key=lambda s: s['capacity'] - s['enrolled'])
+        return open_sections[0]
+
+    def enroll(self, time, student_id, code, section):
+        section['enrolled'] += 1
+        self.stats[code]['enrolled'] += 1
+        if self.rng.random() < self.drop_rate:
+            self.schedule(time + self.rng.uniform(1, 240), DROP, (student_id, code, section['section']))
+
+    def register(self, time, student_id, code):
+        self.stats[code]['demand'] += 1
+        section = self.open_section(code)
+        if section is not None:
+            self.enroll(time, student_id, code, section)
+        elif len(self.waitlist[code]) < self.waitlist_cap[code]:
+            self.waitlist[code].append(student_id)
+            self.stats[code]['waitlisted'] += 1
+        else:
+            self.stats[code]['turned_away'] += 1
+
+    def drop(self, time, student_id, code, section_id):
+        section = next(s for s in self.sections[code] if s['section'] == section_id)
+        section['enrolled'] -= 1
+        self.stats[code]['enrolled'] -= 1
+        self.stats[code]['drops'] += 1
+        if self.waitlist[code]:
+            self.enroll(time, self.waitlist[code].popleft(), code, section)
+
+    def run(self, population):
+        for student_id, standing, requests in population.students:
+            opens = STANDINGS[standing][1]
+            start = opens + self.rng.expovariate(1 / 6)
+            for offset, code in enumerate(requests):
+                self.schedule(start + offset * 0.01, REGISTER, (student_id, code))
+
+        while self.events:
+            time, kind, _, payload = heapq.heappop(self.events)
+            if kind == REGISTER:
+                self.register(time, *payload)
+            else:
+                self.drop(time, *payload)
+
+        # Anyone still on a waitlist when registration closes goes unserved
+        for code, queue in self.waitlist.items():
+            self.stats[code]['unserved'] = len(queue)
+        return self.stats
+
+
+def summarize(stats):
+    return {
+        'demand': sum(s['demand'] for s in stats.values()),
+        'enrolled': sum(s['enrolled'] for s in stats.values()),
+        'waitlisted': sum(s['waitlisted'] for s in stats.values()),
+        'unserved': sum(s['unserved'] for s in stats.values()),
+        'turned_away': sum(s['turned_away'] for s in stats.values()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate registration against proposed schedules')
+    parser.add_argument('--schedule', nargs='*', default=[str(DEFAULT_SCHEDULE)], help='Schedule JSON file(s)')
+    parser.add_argument('--students', type=int, default=400, help='Synthetic population size')
+    parser.add_argument('--courses-per-student', type=float, default=2.0, help='Mean course requests per student')
+    parser.add_argument('--fill', choices=['listed', 'balanced'], default='listed',
+                        help='Section fill order: first listed with seats, or most open seats')
+    parser.add_argument('--waitlist', type=int, default=10, help='Waitlist slots per section')
+    parser.add_argument('--drop-rate', type=float, default=0.08, help='Probability an enrolled seat is dropped')
+    parser.add_argument('--seed', type=int, default=2026, help='Random seed (same seed = same population)')
+    parser.add_argument('--by-course', action='store_true', help='Print per-course results')
+
+    args = parser.parse_args()
+
+    courses = load_markdown_courses(CATALOG_DIR / 'courses')
+    engine = EligibilityEngine(courses)
+
+    print(f"{'Schedule':<40} {'Demand':>7} {'Enrolled':>9} {'Waitlisted':>11} {'Unserved':>9} {'Turned away':>12}")
+    for path in args.schedule:
+        term, quarter, sections = load_schedule(path)
+        offered = sorted({s['code'] for s in sections})
+        population = Population(engine, courses, offered, historical_demand(quarter), args.students,
+                                args.courses_per_student, random.Random(args.seed))
+        sim = RegistrationSimulation(sections, args.fill, args.waitlist, args.drop_rate,
+                                     random.Random(args.seed + 1))
+        stats = sim.run(population)
+        total = summarize(stats)
+        print(f"{f'{term} ({path})'[:40]:<40} {total['demand']:>7} {total['enrolled']:>9} "
+              f"{total['waitlisted']:>11} {total['unserved']:>9} {total['turned_away']:>12}")
+
+        if args.by_course:
+            for code in offered:
+                if code in population.permission_only:
+                    continue
+                s = stats[code]
+                capacity = sum(sec['capacity'] for sec in sim.sections[code])
+                print(f"  {code:<10} cap {capacity:>4}  demand {s['demand']:>5}  enrolled {s['enrolled']:>4}  "
+                      f"waitlisted {s['waitlisted']:>4}  unserved {s['unserved']:>4}  "
+                      f"turned away {s['turned_away']:>5}")
+        if population.permission_only:
+            seats = {code: sum(sec['capacity'] for sec in sim.sections[code]) for code in population.permission_only}
+            listed = ', '.join(f"{code} ({n} seats)" for code, n in seats.items())
+            print(f"  Permission-only, not simulated: {listed}")
+
+
+if __name__ == '__main__':
+    main()
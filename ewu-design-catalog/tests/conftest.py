@@ -0,0 +1,8 @@
+import sys
+from pathlib import Path
+
+CATALOG_DIR = Path(__file__).resolve().parent.parent
+
+# The catalog scripts import each other as top-level modules; workload_calculator.py lives in ../scripts
+sys.path.insert(0, str(CATALOG_DIR))
+sys.path.insert(0, str(CATALOG_DIR.parent / 'scripts'))
@@ -0,0 +1,56 @@
+from catalog_watch import CatalogState
+
+COURSE = """---
+course_code: {code}
+course_name: {name}
+credits: 5
+level: 200
+prerequisites: {prereqs}
+track: foundations
+---
+"""
+
+
+def write(root, code, prereqs="[]", as_code=None, name='Course'):
+    level_dir = root / '200-level'
+    level_dir.mkdir(exist_ok=True)
+    path = level_dir / f"{code}.md"
+    path.write_text(COURSE.format(code=as_code or code, name=name, prereqs=prereqs))
+    return path
+
+
+def test_bad_save_keeps_last_good_record(tmp_path):
+    write(tmp_path, 'DESN-100')
+    path = write(tmp_path, 'DESN-216', "['DESN-100']")
+    state = CatalogState(tmp_path)
+
+    path.write_text(COURSE.format(code='DESN-216', name='Broken', prereqs='[DESN-100]'))
+    assert state.update(path) is False
+    assert state.by_code['DESN-216']['course_name'] == 'Course'
+    assert state.unlocks['DESN-100'] == {'DESN-216'}
+
+
+def test_code_clash_is_reported_and_recovers(tmp_path):
+    write(tmp_path, 'DESN-215', name='InDesign')
+    path = write(tmp_path, 'DESN-216', name='Digital Foundations')
+    state = CatalogState(tmp_path)
+
+    write(tmp_path, 'DESN-216', as_code='DESN-215', name='Digital Foundations')
+    state.update(path)
+    assert list(state.duplicates()) == ['DESN-215']
+    assert 'DESN-216' not in state.by_code
+
+    write(tmp_path, 'DESN-216', name='Digital Foundations')
+    state.update(path)
+    assert state.duplicates() == {}
+    assert state.by_code['DESN-215']['course_name'] == 'InDesign'
+    assert state.by_code['DESN-216']['course_name'] == 'Digital Foundations'
+    assert 'DESN-215' in state.prerequisite_graph()['courses']
+
+
+def test_deleted_file_is_dropped(tmp_path):
+    path = write(tmp_path, 'DESN-100')
+    state = CatalogState(tmp_path)
+    path.unlink()
+    state.update(path)
+    assert state.by_code == {} and state.search == {}
@@ -0,0 +1,54 @@
+from eligibility import EligibilityEngine
+
+
+def course(code, prerequisites=(), **extra):
+    return {'course_code': code, 'prerequisites': list(prerequisites), **extra}
+
+
+CATALOG = [
+    course('DESN-100'),
+    course('DESN-200'),
+    course('DESN-216'),
+    course('DESN-243', ['DESN-100', 'DESN-216']),
+    course('DESN-301', ['DESN-200 or DESN-216']),
+    course('DESN-326', ['DESN-200 or DESN-216 or instructor permission']),
+    course('DESN-480', ['senior standing']),
+    course('DESN-499', ['instructor/chair/dean permission'], repeatable='true'),
+]
+
+
+def eligible(completed):
+    return dict(EligibilityEngine(CATALOG).eligible(completed))
+
+
+def test_all_of_prerequisites_must_all_be_completed():
+    assert 'DESN-243' not in eligible(['DESN-100'])
+    assert 'DESN-243' in eligible(['DESN-100', 'DESN-216'])
+
+
+def test_or_group_of_courses_needs_any_one():
+    assert 'DESN-301' not in eligible([])
+    assert eligible(['DESN-216'])['DESN-301'] is False
+
+
+def test_or_group_with_free_text_is_conditional_until_a_course_alternative_is_done():
+    assert eligible([])['DESN-326'] is True
+    assert eligible(['DESN-200'])['DESN-326'] is False
+    assert eligible(['DESN-100', 'DESN-216'])['DESN-326'] is False
+
+
+def test_standing_and_permission_are_conditional():
+    result = eligible([])
+    assert result['DESN-480'] is True
+    assert result['DESN-499'] is True
+
+
+def test_completed_courses_drop_out_unless_repeatable():
+    result = eligible(['DESN-100', 'DESN-499'])
+    assert 'DESN-100' not in result
+    assert 'DESN-499' in result
+
+
+def test_transcript_codes_are_normalized():
+    engine = EligibilityEngine(CATALOG)
+    assert engine.transcript_mask(['desn 100', 'DESN-216']) == engine.bit['DESN-100'] | engine.bit['DESN-216']
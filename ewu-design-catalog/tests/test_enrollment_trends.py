@@ -0,0 +1,28 @@
+import math
+
+from enrollment_trends import EnrollmentSeries, previous_year_label
+
+
+def test_previous_year_label():
+    assert previous_year_label('Winter 2024-25') == 'Winter 2023-24'
+    assert previous_year_label('Fall 2000-01') == 'Fall 1999-00'
+
+
+def test_growth_compares_same_quarter_despite_summer_and_gaps():
+    store = EnrollmentSeries()
+    store.append_quarter('Fall 2022-23', {'DESN-100': 20})
+    store.append_quarter('Winter 2022-23', {'DESN-100': 30})
+    store.append_quarter('Summer 2022-23', {'DESN-100': 5})
+    # Spring 2022-23 missing entirely
+    store.append_quarter('Fall 2023-24', {'DESN-100': 25})
+    assert store.latest('DESN-100')['yoy_growth'] == 0.25
+
+    store.append_quarter('Spring 2023-24', {'DESN-100': 10})
+    assert math.isnan(store.latest('DESN-100')['yoy_growth'])
+
+
+def test_surge_is_flagged_against_prior_history():
+    store = EnrollmentSeries(threshold=2.0)
+    for i, value in enumerate([20, 21, 19, 20, 60]):
+        store.append_quarter(f"Fall {2020 + i}-{21 + i}", {'DESN-100': value})
+    assert store.latest('DESN-100')['flag'] == 'surge'
@@ -0,0 +1,57 @@
+from itertools import islice
+
+import pytest
+
+import query_courses
+from query_courses import iter_courses, load_all_courses, load_all_courses_parallel
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for level in (100, 200, 300):
+        level_dir = tmp_path / f"{level}-level"
+        level_dir.mkdir()
+        for n in range(7):
+            code = f"DESN-{level + n}"
+            (level_dir / f"{code}.md").write_text(
+                f"---\ncourse_code: {code}\nprerequisites: ['DESN-{level}']\n---\n# {code}\n")
+    (tmp_path / '100-level' / 'notes.md').write_text("No frontmatter\n")
+    return tmp_path
+
+
+def expected(tree):
+    return sorted(load_all_courses(tree), key=lambda c: c['filepath'])
+
+
+@pytest.mark.parametrize('batch_size', [1, 4, 64])
+def test_parallel_load_matches_serial_order(tree, batch_size):
+    assert load_all_courses_parallel(tree, workers=3, batch_size=batch_size) == expected(tree)
+
+
+def test_process_pool_matches_serial_order(tree):
+    assert load_all_courses_parallel(tree, workers=2, processes=True, batch_size=1) == expected(tree)
+
+
+def test_pending_batches_are_bounded(tree, monkeypatch):
+    parsed = []
+
+    def recording_batch(paths):
+        parsed.append(paths)
+        return [query_courses.parse_course_file(p) for p in paths]
+
+    monkeypatch.setattr(query_courses, 'parse_course_batch', recording_batch)
+    courses = iter_courses(tree, workers=1, batch_size=1, max_pending=2)
+    next(courses)
+    # Two batches submitted up front, one more once the first result was taken
+    assert len(parsed) <= 3
+    courses.close()
+    assert len(parsed) <= 3
+
+
+@pytest.mark.parametrize('processes', [False, True])
+def test_stopping_early_shuts_the_pool_down(tree, processes):
+    courses = iter_courses(tree, workers=2, processes=processes, batch_size=1)
+    first = list(islice(courses, 1))
+    courses.close()
+    assert first == expected(tree)[:1]
+    assert next(courses, None) is None
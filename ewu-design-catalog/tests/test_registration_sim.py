@@ -0,0 +1,22 @@
+from eligibility import EligibilityEngine
+from registration_sim import meets_conditions, permission_only
+
+ENGINE = EligibilityEngine([
+    {'course_code': 'DESN-368', 'prerequisites': []},
+    {'course_code': 'DESN-384', 'prerequisites': ['junior standing or instructor permission']},
+    {'course_code': 'DESN-490', 'prerequisites': ['senior standing', 'DESN-368']},
+    {'course_code': 'DESN-495', 'prerequisites': ['junior standing', 'instructor/chair/dean permission']},
+])
+
+
+def test_standing_requirements_follow_class_year():
+    assert not meets_conditions(ENGINE, 'DESN-384', 2, 0)
+    assert meets_conditions(ENGINE, 'DESN-384', 3, 0)
+    assert not meets_conditions(ENGINE, 'DESN-490', 3, 0)
+    assert meets_conditions(ENGINE, 'DESN-490', 4, 0)
+
+
+def test_permission_only_courses_are_detected():
+    assert permission_only(ENGINE, 'DESN-495')
+    assert not permission_only(ENGINE, 'DESN-384')
+    assert not meets_conditions(ENGINE, 'DESN-495', 4, 0)
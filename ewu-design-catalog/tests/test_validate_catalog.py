@@ -0,0 +1,70 @@
+from validate_catalog import ERROR, WARNING, build_index, check_cycles, check_references, validate
+
+
+def course(code, prerequisites=()):
+    return {'course_code': code, 'prerequisites': list(prerequisites), 'filepath': f"{code}.md"}
+
+
+def checks(issues, severity):
+    return [check for sev, check, _ in issues if sev == severity]
+
+
+def test_cycle_is_reported_once_with_all_members():
+    graph = {'DESN-100': ['DESN-300'], 'DESN-200': ['DESN-100'], 'DESN-300': ['DESN-200'], 'DESN-400': []}
+    issues = check_cycles(graph)
+    assert len(issues) == 1
+    assert issues[0][:2] == (ERROR, 'cycle')
+    assert 'DESN-100 -> DESN-200 -> DESN-300' in issues[0][2]
+
+
+def test_self_loop_is_a_cycle():
+    issues = check_cycles({'DESN-100': ['DESN-100'], 'DESN-200': ['DESN-100']})
+    assert [message for _, _, message in issues] == ['prerequisite cycle: DESN-100']
+
+
+def test_acyclic_chain_passes():
+    graph = {f"DESN-{i}": [f"DESN-{i - 1}"] if i > 100 else [] for i in range(100, 2100)}
+    assert check_cycles(graph) == []
+
+
+def test_dangling_desn_prerequisite_is_an_error():
+    index, _ = build_index([course('DESN-300', ['DESN-299'])])
+    graph, issues = check_references(index)
+    assert checks(issues, ERROR) == ['dangling']
+    assert graph == {'DESN-300': []}
+
+
+def test_free_text_and_external_prerequisites_are_warnings():
+    index, _ = build_index([course('DESN-300', ['junior standing', 'ENGL-101'])])
+    _, issues = check_references(index)
+    assert checks(issues, ERROR) == []
+    assert sorted(checks(issues, WARNING)) == ['external', 'free-text']
+
+
+def test_or_group_links_every_course_alternative():
+    index, _ = build_index([
+        course('DESN-200'), course('DESN-216'),
+        course('DESN-326', ['DESN-200 or DESN-216 or instructor permission']),
+    ])
+    graph, issues = check_references(index)
+    assert graph['DESN-326'] == ['DESN-200', 'DESN-216']
+    assert checks(issues, WARNING) == ['free-text']
+
+
+def test_duplicate_codes_are_reported():
+    _, issues = build_index([course('DESN-100'), course('DESN 100')])
+    assert 'duplicate' in checks(issues, ERROR)
+
+
+def test_unparseable_and_empty_course_files_are_reported(tmp_path):
+    level = tmp_path / '100-level'
+    level.mkdir()
+    (level / 'DESN-100.md').write_text("---\ncourse_code: DESN-100\nprerequisites: []\n---\n")
+    (level / 'DESN-101.md').write_text("---\ncourse_code: DESN-101\nprerequisites: [DESN-100]\n---\n")
+    (level / 'DESN-102.md').write_text("No frontmatter here\n")
+    index, issues = validate(tmp_path, tmp_path, generator_path=None)
+    assert list(index) == ['DESN-100']
+    messages = [message for sev, check, message in issues if (sev, check) == (ERROR, 'parse')]
+    assert len(messages) == 2
+    assert 'DESN-101.md: NameError' in messages[0]
+    assert messages[1].endswith('DESN-102.md: no frontmatter')
@@ -0,0 +1,115 @@
+from workload_calculator import WorkloadCalculator, calendar_key
+
+
+MAPPING = {
+    'nameNormalization': {'Breen Melinda': 'Melinda Breen', 'Mills, Simeon': 'Simeon Mills'},
+    'facultyRanks': {
+        'Melinda Breen': 'Full Professor',
+        'Simeon Mills': 'Senior Lecturer',
+        'Ginelle Hustrulid': 'Associate Professor',
+    },
+    'chairAssignments': {
+        'fall-2025': {'chair': 'Breen Melinda', 'releaseTime': 'partial'},
+        'winter-2026': {'chair': 'Melinda Breen', 'releaseTime': 'full'},
+        'spring-2026': {'chair': 'Melinda Breen', 'releaseTime': 'full'},
+    },
+}
+
+RELEASE_TIME = {
+    'academicYears': {'2025-26': {'releaseTime': {'Simeon Mills': {'categories': [
+        {'type': 'advising', 'credits': 4, 'quarters': ['Fall', 'Winter', 'Spring']},
+        {'type': 'committee', 'credits': 2, 'quarters': ['Winter']},
+    ]}}}},
+}
+
+
+def section(instructor, quarter, code='DESN 368', credits=5, enrolled=20, year='2025-26'):
+    return {'academicYear': year, 'quarter': quarter, 'courseCode': code, 'section': '001',
+            'instructor': instructor, 'credits': credits, 'enrolled': enrolled}
+
+
+def calculator():
+    return WorkloadCalculator(MAPPING, RELEASE_TIME)
+
+
+def by_name(report):
+    return {r['faculty']: r for r in report}
+
+
+def test_calendar_key_uses_the_calendar_year_of_the_quarter():
+    assert calendar_key('Fall', '2025-26') == 'fall-2025'
+    assert calendar_key('Winter', '2025-26') == 'winter-2026'
+    assert calendar_key('Spring', '2025-26') == 'spring-2026'
+
+
+def test_names_resolve_through_mapping_flips_and_first_name_drift():
+    calc = calculator()
+    assert calc.normalize_name('Breen Melinda') == 'Melinda Breen'
+    assert calc.normalize_name('Mills, Simeon') == 'Simeon Mills'
+    assert calc.normalize_name('Breen, Melinda') == 'Melinda Breen'
+    assert calc.normalize_name('Hustrulid, Ginell') == 'Ginelle Hustrulid'
+    assert calc.normalize_name('Doe, Jane') == 'Jane Doe'
+
+
+def test_first_name_drift_needs_a_unique_match():
+    calc = WorkloadCalculator({'facultyRanks': {'Ann Lee': 'Lecturer', 'Anna Lee': 'Lecturer'}})
+    assert calc.normalize_name('Lee, An') == 'An Lee'
+
+
+def test_chair_applied_learning_is_excluded_but_still_counted_as_taught():
+    sections = [section('Breen, Melinda', 'Fall'), section('Breen, Melinda', 'Fall', code='DESN 499', credits=5)]
+    breen = by_name(calculator().report(sections))['Melinda Breen']
+    assert breen['quarters']['Fall'] == 5.0
+    assert breen['credits'] == 10.0
+    assert breen['sections'] == 2.0
+
+
+def test_applied_learning_multiplier_applies_to_other_faculty():
+    mills = by_name(calculator().report([section('Mills, Simeon', 'Fall', code='DESN 499')]))['Simeon Mills']
+    assert mills['workloadCredits'] == 1.0
+
+
+def test_full_release_chair_excludes_every_column():
+    sections = [section('Breen, Melinda', 'Winter'), section('Breen, Melinda', 'Spring', enrolled=12)]
+    breen = by_name(calculator().report(sections))['Melinda Breen']
+    assert breen['quarters'] == {'Winter': 0.0, 'Spring': 0.0}
+    assert (breen['credits'], breen['workloadCredits'], breen['students'], breen['sections']) == (0, 0, 0, 0)
+
+
+def test_full_release_quarters_release_a_third_of_capacity_each():
+    breen = by_name(calculator().report([section('Breen, Melinda', 'Fall')]))['Melinda Breen']
+    assert breen['releaseByQuarter'] == {'Winter': 12.0, 'Spring': 12.0}
+    assert breen['releaseCredits'] == 24.0
+    assert breen['netTarget'] == 12.0
+    assert breen['status'] == 'optimal'
+
+
+def test_chair_released_all_year_is_full_release():
+    mapping = dict(MAPPING, chairAssignments={
+        calendar_key(q, '2025-26'): {'chair': 'Melinda Breen', 'releaseTime': 'full'}
+        for q in ('Fall', 'Winter', 'Spring')})
+    breen = by_name(WorkloadCalculator(mapping).report([section('Breen, Melinda', 'Fall')]))['Melinda Breen']
+    assert breen['status'] == 'full-release'
+    assert breen['netTarget'] == 0
+
+
+def test_release_time_is_split_by_quarter():
+    mills = by_name(calculator().report([section('Mills, Simeon', 'Fall')]))['Simeon Mills']
+    assert mills['releaseByQuarter'] == {'Fall': 4, 'Winter': 6, 'Spring': 4}
+    assert mills['releaseCredits'] == 14
+
+
+def test_status_labels_match_the_js_calculator():
+    report = by_name(calculator().report(
+        [section('Mills, Simeon', q, credits=15) for q in ('Fall', 'Winter', 'Spring')]
+        + [section('Hustrulid, Ginell', 'Fall')]
+        + [section('TBD', 'Fall')]))
+    assert report['Simeon Mills']['status'] == 'overloaded'
+    assert report['Ginelle Hustrulid']['status'] == 'underutilized'
+    assert report['Unassigned']['status'] == 'unassigned'
+
+
+def test_co_taught_sections_are_split_between_instructors():
+    report = by_name(calculator().report([section('Mills, Simeon / Hustrulid, Ginelle', 'Fall', enrolled=30)]))
+    assert report['Simeon Mills']['workloadCredits'] == 2.5
+    assert report['Ginelle Hustrulid']['students'] == 15.0
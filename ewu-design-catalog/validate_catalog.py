@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Reference-consistency validator for the EWU Design course catalog.
+
+Builds the course index once and checks, in a single pass over it:
+  - course files that fail to parse or have no frontmatter
+  - duplicate course codes
+  - dangling prerequisite references (unknown DESN courses, other
+    departments' courses, free-text requirements)
+  - prerequisite cycles (Tarjan strongly connected components)
+  - divergence between the markdown files, generate_courses.py and the
+    JSON data files in ../data
+
+Exits non-zero when errors are found so it can gate a deploy.
+Usage examples:
+  python validate_catalog.py
+  python validate_catalog.py --strict
+  python validate_catalog.py --workers 8
+"""
+
+import ast
+import json
+import re
+import sys
+import argparse
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from query_courses import course_files, load_all_courses_parallel, parse_course_file
+
+CATALOG_DIR = Path(__file__).resolve().parent
+DATA_DIR = CATALOG_DIR.parent / 'data'
+GENERATOR_SCRIPT = CATALOG_DIR / 'generate_courses.py'
+
+COURSE_CODE_RE = re.compile(r'\b([A-Z]{2,5})[\s-]?(\d{3})\b')
+DEPARTMENT = 'DESN'
+
+ERROR = 'error'
+WARNING = 'warning'
+
+
+def normalize_code(code):
+    """Normalize 'DESN 100' / 'desn-100' / 'DESN100' to 'DESN-100'"""
+    match = COURSE_CODE_RE.search(str(code).upper())
+    if not match:
+        return str(code).strip()
+    return f"{match.group(1)}-{match.group(2)}"
+
+
+def split_requirement(requirement):
+    """Split one prerequisite entry into its 'or' alternatives"""
+    return [alt.strip() for alt in re.split(r'\s+or\s+', requirement) if alt.strip()]
+
+
+def prerequisite_codes(prereqs):
+    """Return the set of course codes referenced by a prerequisite list"""
+    if isinstance(prereqs, str):
+        prereqs = [prereqs] if prereqs else []
+    codes = set()
+    for requirement in prereqs:
+        for alternative in split_requirement(requirement):
+            if COURSE_CODE_RE.fullmatch(alternative.upper()):
+                codes.add(normalize_code(alternative))
+    return codes
+
+
+def load_markdown_courses(base_path, workers=None):
+    """Parse every course markdown file, reading batches on a thread pool"""
+    return load_all_courses_parallel(base_path, workers)
+
+
+def check_course_file(course_file):
+    """Parse one course file, returning (metadata, issue) so one bad file can't abort the run"""
+    try:
+        metadata = parse_course_file(course_file)
+    except Exception as e:
+        return {}, (ERROR, 'parse', f"{course_file}: {type(e).__name__}: {e}")
+    if not metadata:
+        return {}, (ERROR, 'parse', f"{course_file}: no frontmatter")
+    return metadata, None
+
+
+def load_checked_courses(base_path, workers=None):
+    """Like load_markdown_courses, but reports unparseable files as issues instead of raising"""
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(check_course_file, course_files(base_path)))
+    courses = [metadata for metadata, _ in results if metadata]
+    issues = [issue for _, issue in results if issue]
+    return courses, issues
+
+
+def load_generator_courses(script_path):
+    """Extract the literal `courses` list from generate_courses.py without running it"""
+    tree = ast.parse(Path(script_path).read_text())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+                isinstance(t, ast.Name) and t.id == 'courses' for t in node.targets):
+            return ast.literal_eval(node.value)
+    return []
+
+
+def load_json(path):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def build_index(courses):
+    """Index markdown courses by normalized code, reporting duplicates"""
+    index = {}
+    issues = []
+    for course in courses:
+        code = normalize_code(course.get('course_code', ''))
+        if code in index:
+            issues.append((ERROR, 'duplicate',
+                           f"{code} defined in both {index[code]['filepath']} and {course['filepath']}"))
+            continue
+        if course.get('course_code') != code:
+            issues.append((WARNING, 'format',
+                           f"{course['filepath']}: course_code '{course.get('course_code')}' should be '{code}'"))
+        index[code] = course
+    return index, issues
+
+
+def check_references(index):
+    """Classify every prerequisite alternative and build the prerequisite graph"""
+    graph = {code: [] for code in index}
+    issues = []
+    for code, course in index.items():
+        prereqs = course.get('prerequisites', [])
+        if isinstance(prereqs, str):
+            prereqs = [prereqs] if prereqs else []
+        for requirement in prereqs:
+            for alternative in split_requirement(requirement):
+                if not COURSE_CODE_RE.fullmatch(alternative.upper()):
+                    issues.append((WARNING, 'free-text', f"{code}: non-course prerequisite '{alternative}'"))
+                    continue
+                ref = normalize_code(alternative)
+                if ref in index:
+                    graph[code].append(ref)
+                elif ref.startswith(DEPARTMENT + '-'):
+                    issues.append((ERROR, 'dangling', f"{code}: prerequisite {ref} does not exist"))
+                else:
+                    issues.append((WARNING, 'external', f"{code}: prerequisite {ref} is outside {DEPARTMENT}"))
+    return graph, issues
+
+
+def strongly_connected_components(graph):
+    """Tarjan's algorithm, iterative so deep chains don't hit the recursion limit"""
+    index_of = {}
+    lowlink = {}
+    on_stack = set()
+    stack = []
+    components = []
+    counter = 0
+
+    for root in graph:
+        if root in index_of:
+            continue
+        work = [(root, iter(graph[root]))]
+        index_of[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+
+        while work:
+            node, children = work[-1]
+            child = next(children, None)
+            if child is not None:
+                if child not in index_of:
+                    index_of[child] = lowlink[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(graph.get(child, []))))
+                elif child in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[child])
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index_of[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+
+    return components
+
+
+def check_cycles(graph):
+    issues = []
+    for component in strongly_connected_components(graph):
+        if len(component) > 1 or component[0] in graph.get(component[0], []):
+            members = ' -> '.join(sorted(component))
+            issues.append((ERROR, 'cycle', f"prerequisite cycle: {members}"))
+    return issues
+
+
+def compare_code_sets(index, other_codes, source):
+    issues = []
+    for code in sorted(set(index) - other_codes):
+        issues.append((ERROR, 'divergence', f"{code} is in the markdown catalog but missing from {source}"))
+    for code in sorted(other_codes - set(index)):
+        issues.append((ERROR, 'divergence', f"{code} is in {source} but has no markdown file"))
+    return issues
+
+
+def compare_prerequisites(index, other_prereqs, source):
+    issues = []
+    for code, prereqs in sorted(other_prereqs.items()):
+        if code not in index:
+            continue
+        ours = prerequisite_codes(index[code].get('prerequisites', []))
+        theirs = prerequisite_codes(prereqs)
+        if ours != theirs:
+            issues.append((ERROR, 'divergence',
+                           f"{code}: prerequisites {sorted(ours)} in markdown but {sorted(theirs)} in {source}"))
+    return issues
+
+
+def check_sources(index, generator_courses, catalog_json, graph_json):
+    """Compare the markdown index against every other copy of the catalog"""
+    issues = []
+
+    if generator_courses is not None:
+        generator = {}
+        for course in generator_courses:
+            code = normalize_code(course['code'])
+            if code in generator:
+                issues.append((ERROR, 'duplicate', f"{code} appears twice in generate_courses.py"))
+            generator[code] = course.get('prereqs', [])
+        issues += compare_code_sets(index, set(generator), 'generate_courses.py')
+        issues += compare_prerequisites(index, generator, 'generate_courses.py')
+
+    if catalog_json is not None:
+        counts = Counter(normalize_code(c['code']) for c in catalog_json.get('courses', []))
+        for code in sorted(c for c, n in counts.items() if n > 1):
+            issues.append((ERROR, 'duplicate', f"{code} appears twice in data/course-catalog.json"))
+        issues += compare_code_sets(index, set(counts), 'data/course-catalog.json')
+
+    if graph_json is not None:
+        graph_prereqs = {normalize_code(code): course.get('prerequisites', [])
+                         for code, course in graph_json.get('courses', {}).items()}
+        issues += compare_code_sets(index, set(graph_prereqs), 'data/prerequisite-graph.json')
+        issues += compare_prerequisites(index, graph_prereqs, 'data/prerequisite-graph.json')
+
+    return issues
+
+
+def validate(base_path=CATALOG_DIR / 'courses', data_dir=DATA_DIR, workers=None, generator_path=GENERATOR_SCRIPT):
+    """Run every check and return the list of (severity, check, message) issues"""
+    courses, issues = load_checked_courses(base_path, workers)
+    index, index_issues = build_index(courses)
+    issues += index_issues
+    graph, reference_issues = check_references(index)
+    issues += reference_issues
+    issues += check_cycles(graph)
+
+    data_dir = Path(data_dir)
+    catalog_path = data_dir / 'course-catalog.json'
+    graph_path = data_dir / 'prerequisite-graph.json'
+    issues += check_sources(
+        index,
+        load_generator_courses(generator_path) if generator_path and Path(generator_path).exists() else None,
+        load_json(catalog_path) if catalog_path.exists() else None,
+        load_json(graph_path) if graph_path.exists() else None,
+    )
+    return index, issues
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate EWU Design course catalog references')
+    parser.add_argument('--courses', default=str(CATALOG_DIR / 'courses'), help='Course markdown directory')
+    parser.add_argument('--data', default=str(DATA_DIR), help='Directory holding the JSON data files')
+    parser.add_argument('--generator', default=str(GENERATOR_SCRIPT),
+                        help="generate_courses.py to compare against ('' to skip)")
+    parser.add_argument('--workers', type=int, help='Threads used to read course files')
+    parser.add_argument('--strict', action='store_true', help='Treat warnings as errors')
+    parser.add_argument('--quiet', action='store_true', help='Only print errors and the summary')
+
+    args = parser.parse_args()
+
+    index, issues = validate(args.courses, args.data, args.workers, args.generator)
+    errors = [i for i in issues if i[0] == ERROR]
+    warnings = [i for i in issues if i[0] == WARNING]
+
+    print(f"Validated {len(index)} courses\n")
+    for severity, check, message in issues:
+        if severity == WARNING and args.quiet:
+            continue
+        print(f"  [{severity}] {check}: {message}")
+
+    print(f"\n{len(errors)} error(s), {len(warnings)} warning(s)")
+    if errors or (args.strict and warnings):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+EWU Design faculty workload calculator (Python port of workload-calculator.js).
+
+Aggregates section workload by instructor and quarter from the census CSV
+and the Winter 2026 enrollment JSON, applies release time from
+data/release-time-adjustments.json and reports over/under-load against
+each faculty member's annual capacity.
+
+Workload rules follow workload-calculator.js:
+  - applied learning courses count credits x multiplier (DESN 499 = 0.2, ...)
+  - the chair's applied learning sections are administrative duty (excluded)
+  - a chair on full release has all sections excluded (credits, workload,
+    students and the section count)
+  - release time counts credits x quarters and reduces the annual target;
+    each quarter of full chair release takes a third of the target
+  - status labels match workload-calculator.js (overloaded / optimal /
+    underutilized), plus full-release for a chair released all year
+
+Sections are accumulated into per (instructor, year, quarter) totals in a
+single pass, so the cost is linear in sections.
+
+Usage examples:
+  python scripts/workload_calculator.py
+  python scripts/workload_calculator.py --year 2025-26
+  python scripts/workload_calculator.py --json workload-report.json
+"""
+
+import csv
+import json
+import argparse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CENSUS_CSV = ROOT / 'enrollment-data' / 'processed' / 'corrected-all-quarters.csv'
+WINTER_2026_JSON = ROOT / 'data' / 'winter-2026-enrollments.json'
+RELEASE_TIME_JSON = ROOT / 'data' / 'release-time-adjustments.json'
+FACULTY_MAPPING_JSON = Path(__file__).resolve().parent / 'faculty-mapping.json'
+
+QUARTERS = ['Fall', 'Winter', 'Spring', 'Summer']
+DEFAULT_MULTIPLIERS = {'DESN 499': 0.2, 'DESN 495': 0.1}
+DEFAULT_LIMITS = {
+    'Full Professor': 36,
+    'Associate Professor': 36,
+    'Assistant Professor': 36,
+    'Senior Lecturer': 45,
+    'Lecturer': 45,
+    'Adjunct': 15,
+}
+UNASSIGNED = 'Unassigned'
+
+
+def load_json(path, default=None):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+
+def split_instructors(raw):
+    """Split a co-taught instructor field ('A / B') into individual names"""
+    names = [n.strip() for n in (raw or '').split('/')]
+    return [n for n in names if n and n.upper() != 'TBD']
+
+
+def flip_name(name):
+    """'Mills, Simeon' -> 'Simeon Mills'"""
+    if ',' in name:
+        last, first = name.split(',', 1)
+        return f"{first.strip()} {last.strip()}"
+    return name
+
+
+def term_to_year_quarter(term):
+    """'Winter 2026' -> ('2025-26', 'Winter')"""
+    quarter, year = term.split()
+    year = int(year)
+    start = year if quarter == 'Fall' else year - 1
+    return f"{start}-{str(start + 1)[-2:]}", quarter
+
+
+def calendar_key(quarter, academic_year):
+    """Key used by chairAssignments, e.g. ('Winter', '2025-26') -> 'winter-2026'"""
+    start = int(academic_year.split('-')[0])
+    year = start if quarter == 'Fall' else start + 1
+    return f"{quarter.lower()}-{year}"
+
+
+def read_census_sections(path=CENSUS_CSV):
+    """Yield section dicts from the census CSV"""
+    with open(path, 'r', newline='') as f:
+        for row in csv.DictReader(f):
+            yield {
+                'academicYear': row['AcademicYear'],
+                'quarter': row['Quarter'],
+                'courseCode': row['CourseCode'],
+                'section': row['Section'],
+                'instructor': row['Instructor'],
+                'credits': int(row['Credits'] or 5),
+                'enrolled': int(row['Enrolled'] or 0),
+            }
+
+
+def read_term_sections(path=WINTER_2026_JSON):
+    """Yield section dicts from a term enrollment JSON such as winter-2026-enrollments.json"""
+    data = load_json(path)
+    if not data:
+        return
+    academic_year, quarter = term_to_year_quarter(data['term'])
+    for course in data.get('courses', []):
+        yield {
+            'academicYear': academic_year,
+            'quarter': quarter,
+            'courseCode': course['code'],
+            'section': course.get('section'),
+            'instructor': ' / '.join(split_instructors(course.get('instructor'))),
+            'credits': int(course.get('credits') or 5),
+            'enrolled': int(course.get('enrolled') or 0),
+        }
+
+
+class WorkloadCalculator:
+    def __init__(self, faculty_mapping=None, release_time=None):
+        self.mapping = faculty_mapping or {}
+        self.release_time = release_time or {}
+        self.names = self.mapping.get('nameNormalization', {})
+        self.limits = self.mapping.get('workloadLimits') or DEFAULT_LIMITS
+        self.multipliers = self.release_time.get('appliedLearningMultipliers') or DEFAULT_MULTIPLIERS
+
+        self.canonical = set(self.names.values())
+        self.canonical.update(self.mapping.get('facultyRanks', {}))
+        for status in self.mapping.get('facultyStatusByYear', {}).values():
+            for members in status.values():
+                self.canonical.update(members)
+        self.resolved = {}
+
+    def normalize_name(self, name):
+        """Resolve 'Last, First' / 'Last First' / 'First Last' variants to the mapped name"""
+        if name not in self.resolved:
+            self.resolved[name] = self.resolve_name(name)
+        return self.resolved[name]
+
+    def resolve_name(self, name):
+        for candidate in (name, name.replace(',', ''), flip_name(name)):
+            if candidate in self.names:
+                return self.names[candidate]
+        flipped = flip_name(name)
+        if ',' not in name and flipped in self.canonical:
+            return flipped
+        # Tolerate first-name spelling drift (Ginell / Ginelle): same last name, one first name prefixes the other
+        parts = flipped.split()
+        if len(parts) >= 2:
+            first, last = parts[0].lower(), parts[-1].lower()
+            matches = [c for c in self.canonical
+                       if c.split()[-1].lower() == last
+                       and (c.split()[0].lower().startswith(first) or first.startswith(c.split()[0].lower()))]
+            if len(matches) == 1:
+                return matches[0]
+        return flipped
+
+    def faculty_category(self, name, academic_year):
+        status = self.mapping.get('facultyStatusByYear', {}).get(academic_year, {})
+        for category in ('fullTime', 'sabbatical', 'adjunct', 'former'):
+            if name in status.get(category, []):
+                return category
+        return 'unknown'
+
+    def rank(self, name, academic_year):
+        rank = self.mapping.get('facultyRanks', {}).get(name)
+        if rank:
+            return rank
+        return 'Adjunct' if self.faculty_category(name, academic_year) == 'adjunct' else 'Lecturer'
+
+    def capacity(self, name, academic_year):
+        individual = self.mapping.get('individualCapacities', {}).get(academic_year, {})
+        if name in individual:
+            return individual[name]
+        return self.limits.get(self.rank(name, academic_year), 45)
+
+    def release_credits(self, name, academic_year):
+        """Annual release credits and their per-quarter split"""
+        entry = (self.release_time.get('academicYears', {})
+                 .get(academic_year, {}).get('releaseTime', {}).get(name))
+        by_quarter = {}
+        for category in (entry or {}).get('categories', []):
+            for quarter in category.get('quarters') or QUARTERS[:3]:
+                by_quarter[quarter] = by_quarter.get(quarter, 0) + category.get('credits', 0)
+        return sum(by_quarter.values()), by_quarter
+
+    def full_release_quarters(self, name, academic_year):
+        """Quarters in which this faculty member is chair on full release"""
+        quarters = []
+        for quarter in QUARTERS[:3]:
+            chair = self.mapping.get('chairAssignments', {}).get(calendar_key(quarter, academic_year))
+            if chair and chair.get('releaseTime') == 'full' and self.normalize_name(chair['chair']) == name:
+                quarters.append(quarter)
+        return quarters
+
+    def accumulate(self, sections):
+        """Sum credits, workload, students and sections per (instructor, year, quarter)"""
+        totals = {}
+        for s in sections:
+            instructors = [self.normalize_name(n) for n in split_instructors(s['instructor'])] or [UNASSIGNED]
+            share = 1.0 / len(instructors)
+            multiplier = self.multipliers.get(s['courseCode'], 1.0)
+            applied = multiplier < 1.0
+            chair = self.mapping.get('chairAssignments', {}).get(calendar_key(s['quarter'], s['academicYear']))
+
+            for name in instructors:
+                row = totals.setdefault((name, s['academicYear'], s['quarter']), [0.0, 0.0, 0.0, 0.0])
+                is_chair = bool(chair) and self.normalize_name(chair['chair']) == name
+                if is_chair and chair.get('releaseTime') == 'full':
+                    continue
+                row[0] += s['credits'] * share
+                if not (is_chair and applied):
+                    row[1] += s['credits'] * multiplier * share
+                row[2] += s['enrolled'] * share
+                row[3] += share
+        return totals
+
+    def report(self, sections, academic_year=None):
+        """Per-faculty, per-year workload with quarter breakdown and load status"""
+        faculty = {}
+        for (name, year, quarter), (credits, workload, students, count) in self.accumulate(sections).items():
+            if academic_year and year != academic_year:
+                continue
+            entry = faculty.setdefault((name, year), {
+                'faculty': name,
+                'academicYear': year,
+                'quarters': {},
+                'credits': 0.0,
+                'workloadCredits': 0.0,
+                'students': 0.0,
+                'sections': 0.0,
+            })
+            entry['quarters'][quarter] = round(workload, 2)
+            entry['credits'] += credits
+            entry['workloadCredits'] += workload
+            entry['students'] += students
+            entry['sections'] += count
+
+        results = []
+        for (name, year), entry in sorted(faculty.items(), key=lambda item: (item[0][1], item[0][0])):
+            if name == UNASSIGNED:
+                entry.update(capacity=None, releaseCredits=0, netTarget=None, utilization=None, status='unassigned')
+                results.append(entry)
+                continue
+            capacity = self.capacity(name, year)
+            release, release_by_quarter = self.release_credits(name, year)
+            chair_quarters = self.full_release_quarters(name, year)
+            for quarter in chair_quarters:
+                release_by_quarter[quarter] = release_by_quarter.get(quarter, 0) + capacity / 3
+            release = min(capacity, release + capacity * len(chair_quarters) / 3)
+            net_target = max(0, capacity - release)
+            total = entry['workloadCredits'] + release
+            utilization = round(total / capacity * 100, 1) if capacity else None
+
+            status = 'optimal'
+            if len(chair_quarters) == 3:
+                status = 'full-release'
+            elif utilization is None:
+                status = 'overloaded' if total else 'optimal'
+            elif utilization > 100:
+                status = 'overloaded'
+            elif utilization < 60:
+                status = 'underutilized'
+
+            entry.update(
+                rank=self.rank(name, year),
+                category=self.faculty_category(name, year),
+                capacity=capacity,
+                releaseCredits=release,
+                releaseByQuarter=release_by_quarter,
+                netTarget=net_target,
+                utilization=utilization,
+                balance=round(entry['workloadCredits'] - net_target, 2),
+                status=status,
+            )
+            for field in ('credits', 'workloadCredits', 'students', 'sections'):
+                entry[field] = round(entry[field], 2)
+            results.append(entry)
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Faculty workload by instructor and quarter')
+    parser.add_argument('--csv', default=str(CENSUS_CSV), help='Census enrollment CSV')
+    parser.add_argument('--term-json', nargs='*', default=[str(WINTER_2026_JSON)],
+                        help='Term enrollment JSON files (instructor-level sections)')
+    parser.add_argument('--year', help='Only report this academic year, e.g. 2025-26')
+    parser.add_argument('--json', help='Write the full report to this JSON file')
+
+    args = parser.parse_args()
+
+    calculator = WorkloadCalculator(load_json(FACULTY_MAPPING_JSON, {}), load_json(RELEASE_TIME_JSON, {}))
+    sections = list(read_census_sections(args.csv))
+    for path in args.term_json:
+        term_sections = list(read_term_sections(path))
+        # Term files supersede census rows for the same quarter
+        terms = {(s['academicYear'], s['quarter']) for s in term_sections}
+        sections = [s for s in sections if (s['academicYear'], s['quarter']) not in terms] + term_sections
+
+    report = calculator.report(sections, args.year)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Workload report written to {args.json}")
+        return
+
+    print(f"{'Year':<8} {'Faculty':<22} {'Fall':>5} {'Wntr':>5} {'Sprg':>5} {'Load':>6} "
+          f"{'Rel':>4} {'Cap':>4} {'Util':>6}  Status")
+    for r in report:
+        q = r['quarters']
+        util = f"{r['utilization']:.0f}%" if r['utilization'] is not None else '-'
+        cap = r['capacity'] if r['capacity'] is not None else '-'
+        print(f"{r['academicYear']:<8} {r['faculty'][:22]:<22} {q.get('Fall', 0):>5.1f} {q.get('Winter', 0):>5.1f} "
+              f"{q.get('Spring', 0):>5.1f} {r['workloadCredits']:>6.1f} {r['releaseCredits']:>4g} {cap:>4} "
+              f"{util:>6}  {r['status']}")
+
+
+if __name__ == '__main__':
+    main()